@@ -9,11 +9,8 @@ import sys
 import click
 
 import clinica
-from clinica.engine.template import cli as generate_cli
-from clinica.iotools.converters.cli import cli as convert_cli
-from clinica.iotools.utils.cli import cli as iotools_cli
-from clinica.pipelines.cli import cli as run_cli
 from clinica.utils.exceptions import ClinicaException
+from clinica.utils.lazy_group import LazyGroup
 from clinica.utils.stream import cprint
 
 CONTEXT_SETTINGS = dict(
@@ -23,6 +20,15 @@ CONTEXT_SETTINGS = dict(
     help_option_names=["-h", "--help"],
 )
 
+# Sub-commands of the 'clinica' executable, given as "module:attribute" paths.
+# The corresponding modules are only imported when the sub-command is requested.
+COMMANDS = {
+    "convert": "clinica.iotools.converters.cli:cli",
+    "generate": "clinica.engine.template:cli",
+    "iotools": "clinica.iotools.utils.cli:cli",
+    "run": "clinica.pipelines.cli:cli",
+}
+
 
 def setup_logging(verbose: bool = False) -> None:
     """Setup Clinica's logging facilities.
@@ -95,19 +101,15 @@ def setup_clinica_logging(logging_level: str):
         clinica_logger.addHandler(console_handler)
 
 
-@click.group(context_settings=CONTEXT_SETTINGS)
+@click.group(
+    cls=LazyGroup, lazy_subcommands=COMMANDS, context_settings=CONTEXT_SETTINGS
+)
 @click.version_option(version=clinica.__version__)
 @click.option("-v", "--verbose", is_flag=True, help="Increase logging verbosity.")
 def cli(verbose: bool) -> None:
     setup_logging(verbose=verbose)
 
 
-cli.add_command(convert_cli)
-cli.add_command(generate_cli)
-cli.add_command(iotools_cli)
-cli.add_command(run_cli)
-
-
 def main() -> None:
     try:
         cli()
@@ -1,14 +1,80 @@
 import click
 
+from clinica.utils.lazy_group import LazyGroup
 
-class RegistrationOrderGroup(click.Group):
+# Pipelines available through 'clinica run', given as "module:attribute" paths.
+# Only the module of the requested pipeline is imported when running it.
+PIPELINES = {
+    "pydra-machine-learning-prepare-spatial-svm": "clinica.pydra.machine_learning_spatial_svm.spatial_svm_cli:cli",
+    "pydra-pet-linear": "clinica.pydra.pet_linear.pet_linear_cli:cli",
+    "pydra-pet-volume": "clinica.pydra.pet_volume.pet_volume_cli:cli",
+    "pydra-statistics-volume": "clinica.pydra.statistics_volume.statistics_volume_cli:cli",
+    "pydra-statistics-volume-correction": "clinica.pydra.statistics_volume_correction.statistics_volume_correction_cli:cli",
+    "pydra-t1-freesurfer": "clinica.pydra.t1_freesurfer.cli:cli",
+    "pydra-t1-linear": "clinica.pydra.t1_linear.t1_linear_cli:cli",
+    "pydra-t1-volume-create-dartel": "clinica.pydra.t1_volume.create_dartel.cli:cli",
+    "pydra-t1-volume-dartel2mni": "clinica.pydra.t1_volume.dartel2mni.cli:cli",
+    "pydra-t1-volume-register-dartel": "clinica.pydra.t1_volume.register_dartel.cli:cli",
+    "pydra-t1-volume-tissue-segmentation": "clinica.pydra.t1_volume.tissue_segmentation.cli:cli",
+    "deeplearning-prepare-data": "clinica.pipelines.deeplearning_prepare_data.deeplearning_prepare_data_cli:cli",
+    "dwi-connectome": "clinica.pipelines.dwi.connectome.cli:cli",
+    "dwi-dti": "clinica.pipelines.dwi.dti.cli:cli",
+    "dwi-preprocessing-using-phasediff-fmap": "clinica.pipelines.dwi.preprocessing.fmap.cli:cli",
+    "dwi-preprocessing-using-t1": "clinica.pipelines.dwi.preprocessing.t1.cli:cli",
+    "machinelearning-classification": "clinica.pipelines.machine_learning.classification_cli:cli",
+    "machinelearning-prepare-spatial-svm": "clinica.pipelines.machine_learning_spatial_svm.spatial_svm_cli:cli",
+    "pet-linear": "clinica.pipelines.pet.linear.cli:cli",
+    "pet-volume": "clinica.pipelines.pet.volume.cli:cli",
+    "pet-surface": "clinica.pipelines.pet_surface.pet_surface_cli:cli",
+    "pet-surface-longitudinal": "clinica.pipelines.pet_surface.pet_surface_longitudinal_cli:cli",
+    "statistics-surface": "clinica.pipelines.statistics_surface.cli:cli",
+    "statistics-volume": "clinica.pipelines.statistics_volume.statistics_volume_cli:cli",
+    "statistics-volume-correction": "clinica.pipelines.statistics_volume_correction.statistics_volume_correction_cli:cli",
+    "t1-freesurfer-longitudinal": "clinica.pipelines.anatomical.freesurfer.longitudinal.cli:cli",
+    "t1-freesurfer-longitudinal-correction": "clinica.pipelines.anatomical.freesurfer.longitudinal.correction.cli:cli",
+    "t1-freesurfer-template": "clinica.pipelines.anatomical.freesurfer.longitudinal.template.cli:cli",
+    "t1-freesurfer": "clinica.pipelines.anatomical.freesurfer.t1.cli:cli",
+    "flair-linear": "clinica.pipelines.t1_linear.flair_linear_cli:cli",
+    "t1-linear": "clinica.pipelines.t1_linear.t1_linear_cli:cli",
+    "t1-volume": "clinica.pipelines.t1_volume.t1_volume_cli:cli",
+    "t1-volume-create-dartel": "clinica.pipelines.t1_volume_create_dartel.t1_volume_create_dartel_cli:cli",
+    "t1-volume-dartel2mni": "clinica.pipelines.t1_volume_dartel2mni.t1_volume_dartel2mni_cli:cli",
+    "t1-volume-existing-template": "clinica.pipelines.t1_volume_existing_template.t1_volume_existing_template_cli:cli",
+    "t1-volume-parcellation": "clinica.pipelines.t1_volume_parcellation.t1_volume_parcellation_cli:cli",
+    "t1-volume-register-dartel": "clinica.pipelines.t1_volume_register_dartel.t1_volume_register_dartel_cli:cli",
+    "t1-volume-tissue-segmentation": "clinica.pipelines.t1_volume_tissue_segmentation.t1_volume_tissue_segmentation_cli:cli",
+}
+
+# Pipelines hidden from help and completion, which must match the hidden attribute of their command.
+HIDDEN_PIPELINES = {
+    "pydra-pet-linear",
+    "pydra-pet-volume",
+    "pydra-statistics-volume",
+    "pydra-t1-freesurfer",
+    "pydra-t1-linear",
+    "pydra-t1-volume-create-dartel",
+    "pydra-t1-volume-dartel2mni",
+    "pydra-t1-volume-register-dartel",
+    "pydra-t1-volume-tissue-segmentation",
+}
+
+
+class RegistrationOrderGroup(LazyGroup):
     """CLI group which lists commands by order or registration."""
 
     def list_commands(self, ctx):
-        return self.commands.keys()
+        registered = [
+            name for name in self.commands if name not in self.lazy_subcommands
+        ]
+        return list(self.lazy_subcommands) + registered
 
 
-@click.group(cls=RegistrationOrderGroup, name="run")
+@click.group(
+    cls=RegistrationOrderGroup,
+    name="run",
+    lazy_subcommands=PIPELINES,
+    hidden_subcommands=HIDDEN_PIPELINES,
+)
 def cli() -> None:
     """Run pipelines on BIDS and CAPS datasets."""
     pass
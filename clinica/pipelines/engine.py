@@ -17,16 +17,12 @@ from clinica.utils.stream import log_and_warn
 
 
 def clinica_pipeline(func):
-    """Turns a CLI implementation into a Clinica Pipeline.
+    """Marks a CLI implementation as a Clinica Pipeline.
 
-    More precisely, this decorator takes care of:
-        - registering the implemented command as a subcommand
-          of `clinica run`.
+    This decorator does not register the command: `clinica run` only exposes
+    the pipelines listed in `clinica.pipelines.cli.PIPELINES`, such that their
+    modules are imported on demand. New pipelines must be added to this registry.
     """
-    from clinica.pipelines.cli import cli as run_cli
-
-    run_cli.add_command(func)
-
     return func
 
 
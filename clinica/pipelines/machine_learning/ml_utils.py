@@ -100,8 +100,6 @@ def metric_distribution(
     metric is expected to be ndarray of size [num_repetitions, num_datasets]
 
     """
-    # from __future__ import print_function, division
-
     import matplotlib as mpl
     import matplotlib.pyplot as plt
     import numpy as np
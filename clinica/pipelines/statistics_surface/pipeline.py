@@ -16,68 +16,76 @@ class StatisticsSurface(GroupPipeline):
     Pipeline parameters are explained in StatisticsSurfaceCLI.define_options()
     """
 
+    DEFAULT_PARAMETERS = {
+        "covariates": None,
+        "full_width_at_half_maximum": 20,
+        "acq_label": None,
+        "suvr_reference_region": None,
+        "measure_label": "ct",
+        "cluster_threshold": 0.001,
+        "glm_type": None,
+    }
+
     def _check_pipeline_parameters(self) -> None:
         """Check pipeline parameters."""
         from clinica.utils.exceptions import ClinicaException
 
-        from ._utils import get_pet_surface_custom_file, get_t1_freesurfer_custom_file
-        from .surfstat import get_t1_freesurfer_custom_file_template
-
+        parameters = self.parameters
         for compulsory_parameter_name in ("orig_input_data", "contrast"):
-            if compulsory_parameter_name not in self.parameters:
+            if compulsory_parameter_name not in parameters:
                 raise KeyError(
                     f"Missing compulsory parameter {compulsory_parameter_name}."
                 )
-        self.parameters.setdefault("covariates", None)
-        self.parameters.setdefault("full_width_at_half_maximum", 20)
-        self.parameters.setdefault("acq_label", None)
-        self.parameters.setdefault("suvr_reference_region", None)
-        self.parameters.setdefault(
-            "custom_file",
-            get_t1_freesurfer_custom_file_template(self.caps_directory / "subjects"),
-        )
-        self.parameters.setdefault("measure_label", "ct")
-        self.parameters.setdefault("cluster_threshold", 0.001)
-        self.parameters.setdefault("glm_type", None)
-
-        if self.parameters["orig_input_data"] == "pet-surface":
-            if not self.parameters["acq_label"]:
+        for name, default_value in self.DEFAULT_PARAMETERS.items():
+            parameters.setdefault(name, default_value)
+        orig_input_data = parameters["orig_input_data"]
+        glm_type = parameters["glm_type"]
+        cluster_threshold = parameters["cluster_threshold"]
+        acq_label = parameters["acq_label"]
+        suvr_reference_region = parameters["suvr_reference_region"]
+
+        if orig_input_data == "pet-surface":
+            if not acq_label:
                 raise ClinicaException(
                     "You selected pet-surface pipeline without providing the acq_label "
                     "(by setting the --acq_label option). Clinica will now exit."
                 )
-            if not self.parameters["suvr_reference_region"]:
+            if not suvr_reference_region:
                 raise ClinicaException(
                     "You selected pet-surface pipeline without providing the suvr "
                     "reference region (by setting the --suvr_reference_region option). "
                     "Clinica will now exit."
                 )
-        if self.parameters["glm_type"] not in ("group_comparison", "correlation"):
+        if glm_type not in ("group_comparison", "correlation"):
             raise ClinicaException(
                 f"The glm_type you specified is wrong: it should be group_comparison or "
-                f"correlation (given value: {self.parameters['glm_type']})."
+                f"correlation (given value: {glm_type})."
             )
-        if (
-            self.parameters["cluster_threshold"] < 0
-            or self.parameters["cluster_threshold"] > 1
-        ):
+        if cluster_threshold < 0 or cluster_threshold > 1:
             raise ClinicaException(
                 f"Cluster threshold should be between 0 and 1 "
-                f"(given value: {self.parameters['cluster_threshold']})."
+                f"(given value: {cluster_threshold})."
             )
-        if self.parameters["orig_input_data"] == "t1-freesurfer":
-            self.parameters["custom_file"] = get_t1_freesurfer_custom_file()
-            self.parameters["measure_label"] = "ct"
-        elif self.parameters["orig_input_data"] == "pet-surface":
-            self.parameters["custom_file"] = get_pet_surface_custom_file(
-                self.parameters["acq_label"],
-                self.parameters["suvr_reference_region"],
+        if orig_input_data == "t1-freesurfer":
+            from ._utils import get_t1_freesurfer_custom_file
+
+            parameters["custom_file"] = get_t1_freesurfer_custom_file()
+            parameters["measure_label"] = "ct"
+        elif orig_input_data == "pet-surface":
+            from ._utils import get_pet_surface_custom_file
+
+            parameters["custom_file"] = get_pet_surface_custom_file(
+                acq_label, suvr_reference_region
             )
-            self.parameters["measure_label"] = self.parameters["acq_label"]
+            parameters["measure_label"] = acq_label
         else:
-            if not all(
-                [self.parameters["custom_file"], self.parameters["measure_label"]]
-            ):
+            if "custom_file" not in parameters:
+                from .surfstat import get_t1_freesurfer_custom_file_template
+
+                parameters["custom_file"] = get_t1_freesurfer_custom_file_template(
+                    self.caps_directory / "subjects"
+                )
+            if not all([parameters["custom_file"], parameters["measure_label"]]):
                 raise ClinicaException(
                     "You must provide measure label (use the --measure_label option) "
                     "and a custom file (use the --custom_file option)."
@@ -130,10 +138,11 @@ class StatisticsSurface(GroupPipeline):
         surface_query = []
         # clinica_files_reader expects regexp to start at subjects/ so sub-*/ses-*/ is removed here
         fwhm = str(self.parameters["full_width_at_half_maximum"])
+        cut_pattern = "sub-*/ses-*/"
+        custom_file = self.parameters["custom_file"]
         for direction, hemi in zip(["left", "right"], ["lh", "rh"]):
-            cut_pattern = "sub-*/ses-*/"
             query = {"subject": "sub-*", "session": "ses-*", "hemi": hemi, "fwhm": fwhm}
-            pattern_hemisphere = self.parameters["custom_file"] % query
+            pattern_hemisphere = custom_file % query
             surface_based_info = {
                 "pattern": pattern_hemisphere[
                     pattern_hemisphere.find(cut_pattern) + len(cut_pattern) :
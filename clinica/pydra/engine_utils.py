@@ -1,9 +1,13 @@
+import pickle
 from os import PathLike
 from typing import Optional
 
 from pydra import Submitter, Workflow
 from pydra.engine.specs import Result
 
+# Error files are small dictionaries of strings, anything bigger is suspicious.
+MAX_ERROR_FILE_SIZE = 64 * 1024 * 1024
+
 
 def list_out_fields(wf: Workflow) -> list:
     """Extract the output fields from a Workflow
@@ -85,6 +89,19 @@ def run(wf: Workflow, n_procs: Optional[int] = None) -> Result:
     return wf.result(return_inputs=False)
 
 
+class _ErrorFileUnpickler(pickle.Unpickler):
+    """Unpickler which refuses to load any global.
+
+    Error files only contain builtin types (dict, list, str), such that this
+    prevents the execution of arbitrary code from a corrupted or malicious file.
+    """
+
+    def find_class(self, module: str, name: str):
+        raise pickle.UnpicklingError(
+            f"Global '{module}.{name}' is forbidden when reading error files."
+        )
+
+
 def read_error(path: PathLike) -> str:
     """Read pklz file with error message
 
@@ -97,10 +114,22 @@ def read_error(path: PathLike) -> str:
     -------
     str
         The error message
-    """
 
-    import cloudpickle as cp
+    Raises
+    ------
+    ValueError
+        If the file is larger than MAX_ERROR_FILE_SIZE.
+
+    pickle.UnpicklingError
+        If the file references a global (class, function...).
+    """
+    import os
 
+    if (size := os.stat(path).st_size) > MAX_ERROR_FILE_SIZE:
+        raise ValueError(
+            f"Error file {path} is too large to be read ({size} bytes, "
+            f"maximum is {MAX_ERROR_FILE_SIZE} bytes)."
+        )
     with open(path, "rb") as fp:
-        err = cp.load(fp)
+        err = _ErrorFileUnpickler(fp).load()
     return err["error message"][:-1]
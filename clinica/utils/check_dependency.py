@@ -188,14 +188,10 @@ def is_binary_present(name: str) -> bool:
     -------
     True if the binary is present, False otherwise.
 
-    Warnings
-    --------
-    Do not use this function with a binary GUI, it will open the GUI.
-
-    References
-    ----------
-    Taken from:
-    https://stackoverflow.com/questions/11210104/check-if-a-program-exists-from-a-python-script
+    Notes
+    -----
+    The binary is looked up in the PATH without being executed, such that
+    no process is spawned and GUI programs can safely be checked.
 
     Examples
     --------
@@ -204,18 +200,9 @@ def is_binary_present(name: str) -> bool:
     >>> is_binary_present("foo")
     False
     """
-    import os
-    import subprocess
-
-    from clinica.compat import errno
+    import shutil
 
-    try:
-        devnull = open(os.devnull)
-        subprocess.Popen([name], stdout=devnull, stderr=devnull).communicate()
-    except OSError as e:
-        if e.errno == errno.ENOENT:
-            return False
-    return True
+    return shutil.which(name) is not None
 
 
 def check_binary(name: str):
@@ -1,4 +1,16 @@
-from os import PathLike
+import copy
+import csv
+import functools
+import gzip
+import json
+import os
+import re
+import shutil
+import subprocess
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from os import PathLike, getcwd
+from os.path import abspath, join
 from pathlib import Path
 from typing import Callable, List, Optional, Union
 
@@ -13,6 +25,7 @@ __all__ = [
     "get_filename_no_ext",
     "get_parent",
     "get_subject_id",
+    "get_subject_ids",
     "load_volume",
     "save_participants_sessions",
     "unzip_nii",
@@ -22,6 +35,27 @@ __all__ = [
 
 UserProvidedPath = Union[str, PathLike]
 
+# Buffer size used when streaming data in and out of gzip files.
+_GZIP_BUFFER_SIZE = 1024 * 1024
+
+# Compression level used when zipping files. This is the level used by nibabel
+# when saving images, which is much faster than the default level of 9 for a
+# small increase in file size.
+_GZIP_COMPRESS_LEVEL = 1
+
+# Maximum number of threads used to (un)zip lists of files. This is kept small
+# since these functions are often run by several Nipype processes at once.
+_ZIP_MAX_WORKERS = 4
+
+# Subject and session labels as they appear in a BIDS or CAPS filename.
+_SUBJECT_SESSION_FILENAME_REGEX = re.compile(r"(sub-[a-zA-Z0-9]+)_(ses-[a-zA-Z0-9]+)")
+
+# Subject and session folders as they appear in a BIDS or CAPS path.
+_SUBJECT_SESSION_PATH_REGEX = re.compile(r"(sub-[a-zA-Z0-9]+)/(ses-[a-zA-Z0-9]+)")
+
+# Path to a crash file as reported by Nipype in its log files.
+_CRASH_FILE_REGEX = re.compile(r"crashfile:(.*)")
+
 
 def zip_nii(in_file: str, same_dir: bool = False) -> str:
     """Compress the provided file(s).
@@ -111,46 +145,110 @@ def unzip_nii(
 
 
 def _zip_unzip_nii(in_file: str, same_dir: bool, compress: bool):
-    import gzip
-    import operator
-    import shutil
-    from os import getcwd
-    from os.path import abspath, join
-    from pathlib import Path
-
-    from nipype.utils.filemanip import split_filename
-
     try:
         # Assuming in_file is path-like.
         in_file = Path(in_file)
     except TypeError:
         try:
             # Assuming in_file is a sequence type.
-            return [_zip_unzip_nii(f, same_dir, compress) for f in in_file]
+            in_files = list(in_file)
         except TypeError:
             # All other cases.
             return None
+        return _zip_unzip_nii_files(in_files, same_dir, compress)
 
-    op = operator.eq if compress else operator.ne
-    if op(in_file.suffix, ".gz"):
+    if _is_zipped_or_unzipped(in_file, compress):
         return str(in_file)
 
     if not in_file.exists():
         raise FileNotFoundError(f"File {in_file} does not exist.")
 
-    orig_dir, base, ext = split_filename(str(in_file))
-    new_ext = ext + ".gz" if compress else ext[:-3]
-    out_file = abspath(join(orig_dir if same_dir else getcwd(), base + new_ext))
+    out_file = _get_output_file(in_file, same_dir, compress)
+
+    if compress and shutil.which("pigz"):
+        _compress_with_pigz(in_file, out_file)
+        return out_file
 
     outer = open if compress else gzip.open
-    inner = gzip.open if compress else open
+    inner = (
+        functools.partial(gzip.open, compresslevel=_GZIP_COMPRESS_LEVEL)
+        if compress
+        else open
+    )
     with outer(in_file, "rb") as f_in:
         with inner(out_file, "wb") as f_out:
-            shutil.copyfileobj(f_in, f_out)
+            shutil.copyfileobj(f_in, f_out, _GZIP_BUFFER_SIZE)
 
     return out_file
 
 
+def _zip_unzip_nii_files(in_files: list, same_dir: bool, compress: bool) -> list:
+    """Compress or decompress several files.
+
+    Files are processed by a few threads since zlib releases the GIL while
+    (de)compressing, and threads can safely be spawned from within Nipype's
+    worker processes. When pigz is used, files are compressed one after the
+    other since pigz already uses all available cores for each of them.
+    """
+    zip_unzip = functools.partial(_zip_unzip_nii, same_dir=same_dir, compress=compress)
+    # Files which are already (un)zipped are returned as is, which is the common
+    # case when re-running. Duplicated paths are processed only once.
+    paths = [str(Path(f)) for f in in_files if isinstance(f, (str, PathLike))]
+    pending = list(
+        dict.fromkeys(f for f in paths if not _is_zipped_or_unzipped(f, compress))
+    )
+    # Different files can have the same output file, e.g. files with the same name
+    # in different folders written to the current directory. They are then processed
+    # one after the other, such that the output file is never written concurrently.
+    output_files = {_get_output_file(Path(f), same_dir, compress) for f in pending}
+    max_workers = min(len(pending), _ZIP_MAX_WORKERS)
+    if (
+        max_workers <= 1
+        or len(output_files) < len(pending)
+        or (compress and shutil.which("pigz"))
+    ):
+        processed = {f: zip_unzip(f) for f in pending}
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            processed = dict(zip(pending, executor.map(zip_unzip, pending)))
+    return [
+        processed.get(str(Path(f)), str(Path(f)))
+        if isinstance(f, (str, PathLike))
+        else zip_unzip(f)
+        for f in in_files
+    ]
+
+
+def _get_output_file(in_file: Path, same_dir: bool, compress: bool) -> str:
+    """Return the path of the file resulting from (un)zipping the provided file."""
+    # Whatever the extension of the file, zipping only appends '.gz'
+    # to its name, and unzipping removes it.
+    out_name = in_file.name + ".gz" if compress else in_file.name[:-3]
+    return abspath(join(in_file.parent if same_dir else getcwd(), out_name))
+
+
+def _is_zipped_or_unzipped(in_file, compress: bool) -> bool:
+    """Return True if zipping (or unzipping) the provided file would do nothing."""
+    if not isinstance(in_file, (str, PathLike)):
+        return False
+    return str(in_file).endswith(".gz") == compress
+
+
+def _compress_with_pigz(in_file: Path, out_file: str) -> None:
+    """Compress the provided file with pigz, which uses all available cores."""
+    try:
+        with open(out_file, "wb") as f_out:
+            subprocess.run(
+                ["pigz", "--stdout", f"-{_GZIP_COMPRESS_LEVEL}", str(in_file)],
+                stdout=f_out,
+                check=True,
+            )
+    except subprocess.CalledProcessError:
+        # Do not leave a truncated file which could be taken for a valid one.
+        Path(out_file).unlink(missing_ok=True)
+        raise
+
+
 def load_volume(image_path: str):
     """Load a 3D nifti image from its path.
 
@@ -172,8 +270,6 @@ def load_volume(image_path: str):
     ValueError
         If the loaded image isn't 3D.
     """
-    import copy
-
     import nibabel as nib
 
     img = nib.load(image_path)
@@ -216,10 +312,6 @@ def save_participants_sessions(
         If provided `participant_ids` and `session_ids` do not have
         the same length.
     """
-    from pathlib import Path
-
-    import pandas as pd
-
     from clinica.utils.stream import cprint
 
     if len(participant_ids) != len(session_ids):
@@ -231,23 +323,18 @@ def save_participants_sessions(
     out_folder.mkdir(parents=True, exist_ok=True)
     tsv_file = out_folder / out_file
 
-    data = pd.DataFrame(
-        {
-            "participant_id": participant_ids,
-            "session_id": session_ids,
-        }
-    )
     try:
-        data.to_csv(tsv_file, sep="\t", index=False, encoding="utf-8")
+        with open(tsv_file, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, delimiter="\t", lineterminator="\n")
+            writer.writerow(["participant_id", "session_id"])
+            writer.writerows(zip(participant_ids, session_ids))
     except Exception as e:
-        cprint(msg=f"Impossible to save {out_file} with pandas", lvl="error")
+        cprint(msg=f"Impossible to save {out_file}", lvl="error")
         raise e
 
 
-def _check_bids_or_caps_compliance(filename: str, sep: str):
-    import re
-
-    m = re.search(sep.join([r"(sub-[a-zA-Z0-9]+)", r"(ses-[a-zA-Z0-9]+)"]), filename)
+def _check_bids_or_caps_compliance(filename: str, pattern: re.Pattern) -> re.Match:
+    m = pattern.search(filename)
     if not m:
         raise ValueError(
             f"Input filename {filename} is not in a BIDS or CAPS compliant format."
@@ -289,12 +376,46 @@ def get_subject_id(bids_or_caps_file: Union[str, Path]) -> str:
     --------
     extract_image_ids
     """
-    match = _check_bids_or_caps_compliance(str(bids_or_caps_file), sep="/")
+    match = _check_bids_or_caps_compliance(
+        str(bids_or_caps_file), _SUBJECT_SESSION_PATH_REGEX
+    )
     subject_id = match.group(1) + "_" + match.group(2)
 
     return subject_id
 
 
+def get_subject_ids(bids_or_caps_files: list[Union[str, Path]]) -> list[str]:
+    """Extract the subject IDs from a list of BIDS or CAPS file paths.
+
+    This is the batch version of `get_subject_id()`.
+
+    Parameters
+    ----------
+    bids_or_caps_files: List of str or Path
+        The paths to files from a BIDS or CAPS folder.
+
+    Returns
+    -------
+    subject_ids: List[str]
+        The subject IDs corresponding to the given files, in the same order.
+
+    Examples
+    --------
+    >>> get_subject_ids(["sub-01/ses-M000/pet/sub-01_ses-M000_trc-18FAV45_pet.nii.gz", "sub-02/ses-M006/anat/sub-02_ses-M006_T1w.nii.gz"])
+    ['sub-01_ses-M000', 'sub-02_ses-M006']
+
+    See also
+    --------
+    get_subject_id
+    """
+    return [
+        "_".join(
+            _check_bids_or_caps_compliance(str(f), _SUBJECT_SESSION_PATH_REGEX).groups()
+        )
+        for f in bids_or_caps_files
+    ]
+
+
 def get_filename_no_ext(filename: Union[str, Path]) -> str:
     """Get the filename without the extension.
 
@@ -357,12 +478,10 @@ def extract_image_ids(bids_or_caps_files: list[str]) -> list[str]:
     --------
     get_subject_id
     """
-    id_bids_or_caps_files = []
-    for f in bids_or_caps_files:
-        match = _check_bids_or_caps_compliance(f, sep="_")
-        id_bids_or_caps_files.append(match.group())
-
-    return id_bids_or_caps_files
+    return [
+        _check_bids_or_caps_compliance(f, _SUBJECT_SESSION_FILENAME_REGEX).group()
+        for f in bids_or_caps_files
+    ]
 
 
 def extract_subjects_sessions_from_filename(
@@ -395,10 +514,12 @@ def extract_subjects_sessions_from_filename(
     --------
     extract_image_ids
     """
-    id_bids_or_caps_files = extract_image_ids(bids_or_caps_files)
-    split = [image_id.split("_") for image_id in id_bids_or_caps_files]
-    subject_ids = [p_id[0] for p_id in split]
-    session_ids = [s_id[1] for s_id in split]
+    matches = [
+        _check_bids_or_caps_compliance(f, _SUBJECT_SESSION_FILENAME_REGEX)
+        for f in bids_or_caps_files
+    ]
+    subject_ids = [match.group(1) for match in matches]
+    session_ids = [match.group(2) for match in matches]
     return subject_ids, session_ids
 
 
@@ -415,9 +536,6 @@ def extract_crash_files_from_log_file(filename: str) -> list[str]:
     crash_files: List[str]
         List of crash files.
     """
-    import re
-    from pathlib import Path
-
     filename = Path(filename)
     if not filename.is_file():
         raise ValueError(
@@ -426,8 +544,10 @@ def extract_crash_files_from_log_file(filename: str) -> list[str]:
     crash_files = []
     with open(filename, "r") as log_file:
         for line in log_file:
-            if re.match("(.*)crashfile:(.*)", line):
-                crash_files.append(line.replace("\t crashfile:", "").replace("\n", ""))
+            # Cheap substring test to avoid running the regex on most lines.
+            if "crashfile:" in line:
+                match = _CRASH_FILE_REGEX.search(line)
+                crash_files.append(match.group(1).strip())
 
     return crash_files
 
@@ -455,8 +575,6 @@ def extract_metadata_from_json(
     list of str:
         Contains the values for the requested fields.
     """
-    import json
-
     from clinica.utils.exceptions import ClinicaException
 
     try:
@@ -520,10 +638,7 @@ def _get_folder_size(folder: Union[str, Path]) -> int:
     >>> _get_folder_size("./test/instantiation/")
     52571
     """
-    import os
-    from functools import partial
-
-    prepend = partial(os.path.join, folder)
+    prepend = functools.partial(os.path.join, folder)
     return sum(
         [
             (os.path.getsize(f) if os.path.isfile(f) else _get_folder_size(f))
@@ -584,8 +699,6 @@ def delete_directories(directories: list[Union[str, Path]]) -> None:
     directories : list of str
         Names of the directories we want to delete.
     """
-    import shutil
-
     total_size: int = 0
     for directory in directories:
         total_size += _get_folder_size(str(directory))
@@ -597,8 +710,6 @@ def delete_directories(directories: list[Union[str, Path]]) -> None:
 
 def _print_and_warn(msg: str, lvl: str = "info") -> None:
     """Print the given message with the given level and warns with the same message."""
-    import warnings
-
     from clinica.utils.stream import cprint
 
     cprint(msg=msg, lvl=lvl)
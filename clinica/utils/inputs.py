@@ -2,6 +2,7 @@
 
 import hashlib
 import os
+import re
 from collections import namedtuple
 from enum import Enum
 from functools import partial
@@ -314,8 +315,6 @@ def find_images_path(
     pattern : str
         Define the pattern of the final file.
     """
-    from clinica.utils.stream import cprint
-
     input_directory = Path(input_directory)
     if is_bids:
         origin_pattern = input_directory / subject / session
@@ -324,6 +323,22 @@ def find_images_path(
 
     current_pattern = origin_pattern / "**" / pattern
     current_glob_found = insensitive_glob(str(current_pattern), recursive=True)
+    _select_image_path(current_glob_found, subject, session, errors, valid_paths)
+
+
+def _select_image_path(
+    current_glob_found: List[str],
+    subject: str,
+    session: str,
+    errors: List[InvalidSubjectSession],
+    valid_paths: List[str],
+) -> None:
+    """Appends the file to use among the ones found for subject and session in valid_paths.
+
+    If no file can be selected, the (subject,session) couple is added to the list `errors`.
+    """
+    from clinica.utils.stream import cprint
+
     if len(current_glob_found) > 1:
         # If we have more than one file at this point, there are two possibilities:
         #   - there is a problem somewhere which made us catch too many files
@@ -825,6 +840,106 @@ def _read_files_sequential(
     return results, errors_encountered
 
 
+def _glob_pattern_to_regex(pattern: str) -> re.Pattern:
+    """Compile a glob pattern made of literal names, '*' and '?' into a regular expression.
+
+    The regular expression matches the paths, relative to a given folder, which
+    `insensitive_glob` would return for `<folder>/**/<pattern>`. As with glob,
+    wildcards do not match across '/', nor names of hidden files and folders.
+    """
+
+    def translate(c: str) -> str:
+        if c == "*":
+            return "[^/]*"
+        if c == "?":
+            return "[^/]"
+        # Same case insensitivity as `insensitive_glob`.
+        return "[%s%s]" % (c.lower(), c.upper()) if c.isalpha() else re.escape(c)
+
+    components = [
+        ("(?!\\.)" if component[:1] in ("*", "?") else "")
+        + "".join(map(translate, component))
+        for component in pattern.split("/")
+    ]
+    return re.compile(r"(?:(?!\.)[^/]+/)*" + "/".join(components))
+
+
+def _find_images_paths(
+    input_directory: Path,
+    subject: str,
+    session: str,
+    is_bids: bool,
+    regexes: List[re.Pattern],
+) -> List[List[str]]:
+    """Find the files matching each of the regexes for the given subject and session.
+
+    The session folder is walked only once, whatever the number of regexes.
+    """
+    if is_bids:
+        origin_pattern = input_directory / subject / session
+    else:
+        origin_pattern = input_directory / "subjects" / subject / session
+
+    found = [[] for _ in regexes]
+    for origin in insensitive_glob(str(origin_pattern)):
+        for directory, folder_names, file_names in os.walk(origin, followlinks=True):
+            relative_directory = os.path.relpath(directory, origin).replace(os.sep, "/")
+            prefix = "" if relative_directory == "." else relative_directory + "/"
+            for name in folder_names + file_names:
+                for files, regex in zip(found, regexes):
+                    if regex.fullmatch(prefix + name):
+                        files.append(os.path.join(directory, name))
+
+    return found
+
+
+def _read_files_for_patterns(
+    subjects: List[str],
+    sessions: List[str],
+    input_directory: os.PathLike,
+    patterns: List[str],
+) -> List[Tuple[List[str], List[InvalidSubjectSession]]]:
+    """Read files matching several patterns for each subject and session at once.
+
+    This is equivalent to calling `clinica_file_reader` for each pattern,
+    but each session folder is walked once instead of once per pattern.
+    """
+    input_directory = Path(input_directory)
+    is_bids = determine_caps_or_bids(input_directory)
+    if is_bids:
+        check_bids_folder(input_directory)
+    else:
+        check_caps_folder(input_directory)
+
+    if len(subjects) != len(sessions):
+        raise ValueError("Subjects and sessions must have the same length.")
+
+    regexes = [_glob_pattern_to_regex(pattern) for pattern in patterns]
+    results = [([], []) for _ in patterns]
+    for subject, session in zip(subjects, sessions):
+        found = _find_images_paths(input_directory, subject, session, is_bids, regexes)
+        for files, (valid_paths, errors) in zip(found, results):
+            _select_image_path(files, subject, session, errors, valid_paths)
+
+    return results
+
+
+def _is_batchable_information(information) -> bool:
+    """Whether the files described by `information` can be read with `_read_files_for_patterns`.
+
+    Only patterns made of literal names, '*' and '?' are supported.
+    """
+    if not isinstance(information, dict):
+        return False
+    pattern = information.get("pattern")
+    return (
+        isinstance(pattern, str)
+        and "[" not in pattern
+        and "**" not in pattern
+        and all(component not in ("", ".", "..") for component in pattern.split("/"))
+    )
+
+
 def clinica_list_of_files_reader(
     participant_ids: List[str],
     session_ids: List[str],
@@ -863,15 +978,27 @@ def clinica_list_of_files_reader(
     """
     from .exceptions import ClinicaBIDSError
 
-    all_errors = []
-    list_found_files = []
-    for info_file in list_information:
-        files, errors = clinica_file_reader(
+    if list_information and all(map(_is_batchable_information, list_information)):
+        _check_information(list_information)
+        results = _read_files_for_patterns(
             participant_ids,
             session_ids,
             bids_or_caps_directory,
-            info_file,
+            [info_file["pattern"] for info_file in list_information],
         )
+    else:
+        results = [
+            clinica_file_reader(
+                participant_ids,
+                session_ids,
+                bids_or_caps_directory,
+                info_file,
+            )
+            for info_file in list_information
+        ]
+    all_errors = []
+    list_found_files = []
+    for files, errors in results:
         all_errors.append(errors)
         list_found_files.append([] if errors else files)
 
@@ -0,0 +1,69 @@
+"""Click group lazily importing its sub-commands."""
+
+from typing import Dict, Iterable, Optional
+
+import click
+
+
+class LazyGroup(click.Group):
+    """CLI group which imports its sub-commands only when they are invoked.
+
+    Sub-commands are declared with a mapping from their name to the
+    "module:attribute" path of the corresponding click command, such
+    that heavy modules (Nipype, pipelines...) are not imported when
+    running an unrelated sub-command. The names of the hidden lazy
+    sub-commands are given separately, since their `hidden` attribute
+    is only known once they are imported.
+    """
+
+    def __init__(
+        self,
+        *args,
+        lazy_subcommands: Optional[Dict[str, str]] = None,
+        hidden_subcommands: Optional[Iterable[str]] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+        self.hidden_subcommands = frozenset(hidden_subcommands or ())
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            return self._lazy_load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def shell_complete(self, ctx, incomplete):
+        """Complete sub-command names without importing the lazy sub-commands.
+
+        Click's default implementation loads every sub-command to retrieve
+        its short help, which would import all the pipelines on each TAB press.
+        """
+        from click.shell_completion import CompletionItem
+
+        results = [
+            CompletionItem(name)
+            for name in self.list_commands(ctx)
+            if name.startswith(incomplete) and not self._is_hidden(name)
+        ]
+        results.extend(click.Command.shell_complete(self, ctx, incomplete))
+        return results
+
+    def _is_hidden(self, cmd_name: str) -> bool:
+        if cmd_name in self.hidden_subcommands:
+            return True
+        return getattr(self.commands.get(cmd_name), "hidden", False)
+
+    def _lazy_load(self, cmd_name: str) -> click.Command:
+        import importlib
+
+        module_name, attribute = self.lazy_subcommands[cmd_name].split(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise ValueError(
+                f"Lazy loading of {self.lazy_subcommands[cmd_name]} failed "
+                f"by returning a non-command object: {type(command)}."
+            )
+        return command
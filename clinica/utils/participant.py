@@ -35,7 +35,7 @@ def get_unique_subjects(
     >>> get_unique_subjects(['sub-CLNC01', 'sub-CLNC01', 'sub-CLNC02'], ['ses-M000', 'ses-M018', 'ses-M000'])
     (['sub-CLNC01', 'sub-CLNC02'], [['ses-M000', 'ses-M018'], ['ses-M000']])
     """
-    import numpy as np
+    import pandas as pd
 
     if len(subjects) != len(sessions):
         raise ValueError(
@@ -43,23 +43,15 @@ def get_unique_subjects(
             f"You provided the following subjects: {subjects}.\n"
             f"And the following sessions: {sessions}."
         )
-    subjects = np.array(subjects)
-    sessions = np.array(sessions)
-
-    # The second returned element indicates for each participant_id the
-    # element they correspond to in the 'unique' list. We will use this
-    # to link each session_id in the repeated list of session_id to
-    # their corresponding unique participant_id
-
-    unique_subjects, inverse_positions = np.unique(subjects, return_inverse=True)
-    sessions_per_subject = [
-        sessions[inverse_positions == subject_index].tolist()
-        for subject_index in range(len(unique_subjects))
-    ]
-    if len(unique_subjects) != len(sessions_per_subject):
-        raise ValueError("Problem while getting unique subjects and sessions lists.")
+    # A single groupby pass gathers the sessions of each participant, sorted by
+    # participant ID, while keeping the order of the sessions within each group.
+    sessions_per_subject = (
+        pd.DataFrame({"subject": subjects, "session": sessions}, dtype=object)
+        .groupby("subject", sort=True)["session"]
+        .apply(list)
+    )
 
-    return unique_subjects.tolist(), sessions_per_subject
+    return sessions_per_subject.index.tolist(), sessions_per_subject.tolist()
 
 
 def unique_subjects_sessions_to_subjects_sessions(
@@ -139,12 +131,18 @@ def _read_participant_tsv(
     >>> _read_participant_tsv("participant.tsv")
     (["sub-01", "sub-01", "sub-02"], ["ses-M000", "ses-M006", "ses-M000"])
     """
-    import pandas as pd
+    import csv
 
     from clinica.utils.exceptions import ClinicaException
 
+    # The csv module is used rather than pandas since only two columns of
+    # strings are needed, which avoids the cost of importing pandas.
+    # As with pandas, the file is decoded as UTF-8 and a leading BOM is skipped.
     try:
-        df = pd.read_csv(tsv_file, sep="\t")
+        with open(tsv_file, newline="", encoding="utf-8-sig") as f:
+            reader = csv.DictReader(f, delimiter="\t")
+            columns = reader.fieldnames or []
+            rows = list(reader)
     except FileNotFoundError:
         raise ClinicaException(
             "The TSV file you gave is not a file.\nError explanations:\n"
@@ -153,14 +151,14 @@ def _read_participant_tsv(
         )
 
     for column in ("participant_id", "session_id"):
-        if column not in list(df.columns.values):
+        if column not in columns:
             raise ClinicaException(
                 f"The TSV file does not contain {column} column (path: {tsv_file})"
             )
 
     return (
-        [sub.strip(" ") for sub in list(df.participant_id)],
-        [ses.strip(" ") for ses in list(df.session_id)],
+        [row["participant_id"].strip(" ") for row in rows],
+        [row["session_id"].strip(" ") for row in rows],
     )
 
 
@@ -218,15 +216,16 @@ def get_subject_session_list(
     with e.g. clinica_file_reader_function.
     """
     import tempfile
+    import uuid
     from pathlib import Path
-    from time import localtime, strftime, time
 
     from clinica.iotools.utils.data_handling import create_subs_sess_list
 
     if not subject_session_file:
         output_dir = Path(tsv_dir) if tsv_dir else Path(tempfile.mkdtemp())
-        timestamp = strftime("%Y%m%d_%H%M%S", localtime(time()))
-        tsv_file = f"subjects_sessions_list_{timestamp}.tsv"
+        # A unique file name is needed since several pipelines may write
+        # their list of subjects and sessions to the same folder concurrently.
+        tsv_file = f"subjects_sessions_list_{uuid.uuid4().hex}.tsv"
         subject_session_file = output_dir / tsv_file
         create_subs_sess_list(
             input_dir=input_dir,
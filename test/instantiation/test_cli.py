@@ -2,6 +2,7 @@ import pytest
 from click.testing import CliRunner
 
 from clinica.cmdline import cli
+from clinica.pipelines.cli import HIDDEN_PIPELINES, PIPELINES
 
 # Test to ensure that the help string at the command line is invoked without errors
 
@@ -129,3 +130,65 @@ def test_second_lv_run(generate_cli_second_lv_run):
     print(f"Testing input cli run {cli_input}")
     result = runner.invoke(cli, f"run {cli_input} -h")
     assert result.exit_code == 0
+
+
+def test_cli_import_does_not_import_pipelines():
+    """Importing the CLI entry point should not import the pipelines."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys; import clinica.cmdline; "
+        "sys.exit(int('clinica.pipelines' in sys.modules))"
+    )
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
+@pytest.mark.parametrize("pipeline_name", list(PIPELINES))
+def test_pipelines_registry(pipeline_name):
+    """Check that each registered pipeline resolves to the expected command."""
+    import click
+
+    from clinica.pipelines.cli import cli as run_cli
+
+    command = run_cli.get_command(click.Context(run_cli), pipeline_name)
+
+    assert command.name == pipeline_name
+    assert command.hidden == (pipeline_name in HIDDEN_PIPELINES)
+
+
+def test_clinica_pipelines_are_registered():
+    """Check that each module defining a pipeline CLI is listed in the registry."""
+    from pathlib import Path
+
+    import clinica
+
+    registered_modules = {path.split(":")[0] for path in PIPELINES.values()}
+    root = Path(clinica.__file__).parent
+    decorated_modules = {
+        ".".join(path.relative_to(root.parent).with_suffix("").parts)
+        for folder in ("pipelines", "pydra")
+        for path in (root / folder).rglob("*.py")
+        if "@clinica_pipeline\n" in path.read_text()
+    }
+
+    assert decorated_modules
+    assert decorated_modules <= registered_modules
+
+
+def test_run_completion_does_not_import_pipelines(mocker):
+    import click
+
+    from clinica.pipelines.cli import cli as run_cli
+
+    lazy_load = mocker.patch.object(type(run_cli), "_lazy_load")
+    completions = run_cli.shell_complete(click.Context(run_cli), "t1-lin")
+
+    assert [item.value for item in completions] == ["t1-linear"]
+    completions = run_cli.shell_complete(click.Context(run_cli), "pyd")
+    assert [item.value for item in completions] == [
+        "pydra-machine-learning-prepare-spatial-svm",
+        "pydra-statistics-volume-correction",
+    ]
+    assert run_cli.shell_complete(click.Context(run_cli), "pydra-t1") == []
+    lazy_load.assert_not_called()
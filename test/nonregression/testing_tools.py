@@ -437,7 +437,8 @@ def compare_folders_with_hashes(
     """
     import pickle
 
-    hashes_check = pickle.load(open(list_hashes, "rb"))
+    with open(list_hashes, "rb") as f:
+        hashes_check = pickle.load(f)
     hashes_new = create_list_hashes(path_folder)
 
     if hashes_check != hashes_new:
@@ -470,7 +471,8 @@ def compare_folders_structures(
     """
     import pickle
 
-    hashes_check = pickle.load(open(list_hashes, "rb"))
+    with open(list_hashes, "rb") as f:
+        hashes_check = pickle.load(f)
     hashes_new = create_list_hashes(path_folder)
 
     if set(hashes_check.keys()) != set(hashes_new.keys()):
@@ -135,13 +135,13 @@ def test_read_xml_files_error(tmp_path):
         _read_xml_files()
 
 
-def test_read_xml_files(tmp_path):
+def test_read_xml_files(tmp_path, monkeypatch):
     """Test function `_read_xml_files`."""
     from clinica.iotools.converters.adni_to_bids.adni_json import _read_xml_files  # noqa
 
     xml_path = tmp_path / "xml_files"
     xml_path.mkdir()
-    os.chdir(xml_path)
+    monkeypatch.chdir(xml_path)
     clinica_path = xml_path / "Clinica_processed_metadata"
     clinica_path.mkdir()
     dummy_file = clinica_path / "ADNI_1234.xml"
@@ -157,7 +157,6 @@ def test_read_xml_files(tmp_path):
     assert _read_xml_files(subjects, xml_path) == [
         xml_path / f"ADNI_{subj}.xml" for subj in subjects
     ]
-    os.chdir(os.path.dirname(__file__))
 
 
 def _load_xml_from_template(
@@ -0,0 +1,54 @@
+import os
+import pickle
+
+import pytest
+
+
+def test_read_error(tmp_path):
+    from clinica.pydra.engine_utils import read_error
+
+    with open(tmp_path / "_error.pklz", "wb") as fp:
+        pickle.dump({"error message": ["foo\n", "bar\n", "\n"]}, fp)
+
+    assert read_error(tmp_path / "_error.pklz") == ["foo\n", "bar\n"]
+
+
+def test_read_error_forbidden_global(tmp_path):
+    from clinica.pydra.engine_utils import read_error
+
+    with open(tmp_path / "_error.pklz", "wb") as fp:
+        pickle.dump({"error message": [os.getcwd]}, fp)
+
+    with pytest.raises(pickle.UnpicklingError, match="is forbidden"):
+        read_error(tmp_path / "_error.pklz")
+
+
+def test_read_error_forbidden_dotted_global(tmp_path):
+    """A dotted name must not reach a global imported by an allowed module."""
+    from clinica.pydra.engine_utils import read_error
+
+    def short_unicode(text: str) -> bytes:
+        return b"\x8c" + bytes([len(text)]) + text.encode()
+
+    # PROTO 4, STACK_GLOBAL('clinica.utils.inputs', 'os.getcwd'), REDUCE(()), STOP
+    payload = (
+        b"\x80\x04"
+        + short_unicode("clinica.utils.inputs")
+        + short_unicode("os.getcwd")
+        + b"\x93)R."
+    )
+    (tmp_path / "_error.pklz").write_bytes(payload)
+
+    with pytest.raises(pickle.UnpicklingError, match="is forbidden"):
+        read_error(tmp_path / "_error.pklz")
+
+
+def test_read_error_too_large(tmp_path, mocker):
+    from clinica.pydra.engine_utils import read_error
+
+    mocker.patch("clinica.pydra.engine_utils.MAX_ERROR_FILE_SIZE", 10)
+    with open(tmp_path / "_error.pklz", "wb") as fp:
+        pickle.dump({"error message": ["foo bar baz\n"]}, fp)
+
+    with pytest.raises(ValueError, match="is too large to be read"):
+        read_error(tmp_path / "_error.pklz")
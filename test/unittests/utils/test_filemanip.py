@@ -48,6 +48,117 @@ def test_zip_unzip_nii(tmp_path):
     assert line == "Test"
 
 
+def test_zip_nii_without_pigz(tmp_path, mocker):
+    """Test that files are zipped with gzip when pigz is not available."""
+    import gzip
+
+    from clinica.utils.filemanip import zip_nii
+
+    mocker.patch("shutil.which", return_value=None)
+    (tmp_path / "foo.nii").write_text("Test")
+
+    assert zip_nii(tmp_path / "foo.nii", same_dir=True) == str(tmp_path / "foo.nii.gz")
+    with gzip.open(tmp_path / "foo.nii.gz", "rt") as f:
+        assert f.read() == "Test"
+
+
+def test_zip_nii_pigz_error(tmp_path, mocker):
+    """Test that no truncated file is left when pigz fails."""
+    import subprocess
+
+    from clinica.utils.filemanip import zip_nii
+
+    mocker.patch("shutil.which", return_value="/usr/bin/pigz")
+    mocker.patch("subprocess.run", side_effect=subprocess.CalledProcessError(1, "pigz"))
+    (tmp_path / "foo.nii").write_text("Test")
+
+    with pytest.raises(subprocess.CalledProcessError):
+        zip_nii(tmp_path / "foo.nii", same_dir=True)
+    assert not (tmp_path / "foo.nii.gz").exists()
+
+
+def test_zip_unzip_nii_list(tmp_path):
+    """Test that lists of files are processed and returned in order."""
+    from clinica.utils.filemanip import unzip_nii, zip_nii
+
+    files = [tmp_path / f"foo_{i}.nii" for i in range(5)]
+    for i, file in enumerate(files):
+        file.write_text(f"Test {i}")
+
+    zipped = zip_nii(files, same_dir=True)
+
+    assert zipped == [f"{file}.gz" for file in files]
+    for file in files:
+        file.unlink()
+    assert unzip_nii(zipped, same_dir=True) == [str(file) for file in files]
+    assert [file.read_text() for file in files] == [f"Test {i}" for i in range(5)]
+
+
+def test_zip_nii_list_already_zipped(tmp_path, mocker):
+    """Test that already zipped files are not dispatched to the thread pool."""
+    from clinica.utils.filemanip import zip_nii
+
+    executor = mocker.patch("clinica.utils.filemanip.ThreadPoolExecutor")
+    files = [tmp_path / f"foo_{i}.nii.gz" for i in range(3)] + [None]
+
+    assert zip_nii(files) == [str(file) for file in files[:-1]] + [None]
+    executor.assert_not_called()
+
+
+def test_zip_nii_list_duplicates(tmp_path, mocker):
+    """Test that duplicated files are zipped only once."""
+    from clinica.utils import filemanip
+
+    mocker.patch("shutil.which", return_value=None)
+    zip_unzip = mocker.spy(filemanip, "_zip_unzip_nii")
+    files = [tmp_path / "foo.nii", tmp_path / "bar.nii"]
+    for file in files:
+        file.write_text("Test")
+
+    zipped = filemanip.zip_nii(files + [str(tmp_path / "foo.nii")], same_dir=True)
+
+    assert zipped == [f"{file}.gz" for file in files] + [f"{files[0]}.gz"]
+    # One call for the list, then one per distinct file.
+    assert zip_unzip.call_count == 3
+
+
+def test_zip_nii_list_same_output_file(tmp_path, mocker, monkeypatch):
+    """Test that files with the same output file are not zipped concurrently."""
+    import gzip
+
+    from clinica.utils.filemanip import zip_nii
+
+    mocker.patch("shutil.which", return_value=None)
+    executor = mocker.patch("clinica.utils.filemanip.ThreadPoolExecutor")
+    files = [tmp_path / folder / "foo.nii" for folder in ("a", "b", "c")]
+    for file in files:
+        file.parent.mkdir()
+        file.write_text(f"Test {file.parent.name}")
+    (tmp_path / "out").mkdir()
+    monkeypatch.chdir(tmp_path / "out")
+
+    assert zip_nii(files) == [str(tmp_path / "out" / "foo.nii.gz")] * 3
+    executor.assert_not_called()
+    with gzip.open(tmp_path / "out" / "foo.nii.gz", "rt") as f:
+        assert f.read() == "Test c"
+
+
+def test_zip_nii_list_with_pigz(tmp_path, mocker):
+    """Test that files are compressed one after the other when pigz is available."""
+    from clinica.utils.filemanip import zip_nii
+
+    mocker.patch("shutil.which", return_value="/usr/bin/pigz")
+    compress = mocker.patch("clinica.utils.filemanip._compress_with_pigz")
+    executor = mocker.patch("clinica.utils.filemanip.ThreadPoolExecutor")
+    files = [tmp_path / f"foo_{i}.nii" for i in range(3)]
+    for file in files:
+        file.write_text("Test")
+
+    assert zip_nii(files, same_dir=True) == [f"{file}.gz" for file in files]
+    assert compress.call_count == 3
+    executor.assert_not_called()
+
+
 @pytest.fixture
 def test_image(case) -> nib.Nifti1Image:
     shapes = {
@@ -152,6 +263,22 @@ def test_get_subject_id(filename, expected):
     assert get_subject_id(filename) == expected
 
 
+def test_get_subject_ids():
+    from clinica.utils.filemanip import get_subject_ids
+
+    assert get_subject_ids(
+        [
+            "sub-01/ses-M000/pet/sub-01_ses-M000_trc-18FAV45_pet.nii.gz",
+            Path("foo/sub-02/ses-M006/anat/sub-02_ses-M006_T1w.nii.gz"),
+        ]
+    ) == ["sub-01_ses-M000", "sub-02_ses-M006"]
+    with pytest.raises(
+        ValueError,
+        match="is not in a BIDS or CAPS compliant format",
+    ):
+        get_subject_ids(["sub-01_ses-M000_T1w.nii.gz"])
+
+
 @pytest.mark.parametrize(
     "filename,expected",
     [
@@ -218,6 +345,22 @@ def test_extract_crash_files_from_log_file_error():
         extract_crash_files_from_log_file("foo.log")
 
 
+def test_extract_crash_files_from_log_file(tmp_path):
+    from clinica.utils.filemanip import extract_crash_files_from_log_file
+
+    (tmp_path / "pipeline.log").write_text(
+        "Node foo failed to run on host bar.\n"
+        "\t crashfile: /path/to/crash-foo.pklz\n"
+        "Saving crash info to /path/to/crash-foo.pklz\n"
+        "\t crashfile: /path/to/crash-bar.pklz\n"
+    )
+
+    assert extract_crash_files_from_log_file(tmp_path / "pipeline.log") == [
+        "/path/to/crash-foo.pklz",
+        "/path/to/crash-bar.pklz",
+    ]
+
+
 def test_extract_metadata_from_json_missing_file_error(tmp_path):
     from clinica.utils.filemanip import extract_metadata_from_json
 
@@ -1,3 +1,5 @@
+import os
+
 import pandas as pd
 import pytest
 
@@ -14,6 +16,14 @@ import pytest
                 [["ses-M000", "ses-M018"], ["ses-M000"]],
             ),
         ),
+        (
+            ["sub-CLNC02", "sub-CLNC01", "sub-CLNC02", "sub-CLNC01"],
+            ["ses-M018", "ses-M006", "ses-M000", "ses-M000"],
+            (
+                ["sub-CLNC01", "sub-CLNC02"],
+                [["ses-M006", "ses-M000"], ["ses-M018", "ses-M000"]],
+            ),
+        ),
     ],
 )
 def test_get_unique_subjects(subjects, sessions, expected):
@@ -102,6 +112,25 @@ def test_get_subject_session_list(tmp_path, config, expected):
     )
 
 
+def test_get_subject_session_list_unique_files(tmp_path):
+    """Test that each call writes its own subjects-sessions TSV file."""
+    from clinica.utils.participant import get_subject_session_list
+    from clinica.utils.testing_utils import build_bids_directory
+
+    (tmp_path / "bids").mkdir()
+    build_bids_directory(tmp_path / "bids", {"sub-01": ["ses-M000"]})
+    (tmp_path / "tsv").mkdir()
+    for _ in range(2):
+        get_subject_session_list(tmp_path / "bids", tsv_dir=tmp_path / "tsv")
+
+    tsv_files = list((tmp_path / "tsv").glob("subjects_sessions_list_*.tsv"))
+    assert len(tsv_files) == 2
+    # Files are created with the default permissions rather than private ones.
+    umask = os.umask(0)
+    os.umask(umask)
+    assert all(f.stat().st_mode & 0o777 == 0o666 & ~umask for f in tsv_files)
+
+
 def test_read_participant_tsv_error(tmp_path):
     from clinica.utils.exceptions import ClinicaException
     from clinica.utils.participant import _read_participant_tsv
@@ -137,3 +166,17 @@ def test_read_participant_tsv(tmp_path):
             match=f"The TSV file does not contain {column} column",
         ):
             _read_participant_tsv(tmp_path / "foo.tsv")
+
+
+def test_read_participant_tsv_with_bom(tmp_path):
+    from clinica.utils.participant import _read_participant_tsv
+
+    (tmp_path / "foo.tsv").write_text(
+        "\ufeffparticipant_id\tsession_id\nsub-01\tses-M000\nsub-02\tses-M006\n",
+        encoding="utf-8",
+    )
+
+    assert _read_participant_tsv(tmp_path / "foo.tsv") == (
+        ["sub-01", "sub-02"],
+        ["ses-M000", "ses-M006"],
+    )
@@ -805,6 +805,64 @@ def test_clinica_list_of_files_reader(tmp_path):
     assert len(results[1]) == 0
 
 
+def test_read_files_for_patterns(tmp_path):
+    from clinica.utils.inputs import _read_files_for_patterns, clinica_file_reader
+
+    config = {
+        "sub-01": ["ses-M00"],
+        "sub-02": ["ses-M00", "ses-M06"],
+    }
+    build_bids_directory(tmp_path, config)
+    (tmp_path / "sub-01" / "ses-M00" / "anat" / ".sub-01_ses-M00_T1w.nii.gz").touch()
+    patterns = [
+        "sub-*_ses-*_t1w.nii*",
+        "anat/*_FLAIR.nii*",
+        "ANAT/sub-0?_ses-m00_*",
+        "*.nii.gz",
+        "sub-*_ses-*_foo.nii*",
+    ]
+    # Subject and session folders are matched regardless of the case, as with glob.
+    subjects = ["SUB-02", "sub-01", "sub-02"]
+    sessions = ["ses-M06", "SES-m00", "ses-M00"]
+
+    results = _read_files_for_patterns(subjects, sessions, tmp_path, patterns)
+
+    assert results == [
+        clinica_file_reader(
+            subjects, sessions, tmp_path, {"pattern": pattern, "description": ""}
+        )
+        for pattern in patterns
+    ]
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    ["[ab]nat/*", "*[a-c]*", "[!s]*", "[!]]*", "anat//*", "**/*_T1w.nii.gz", "anat/"],
+)
+def test_clinica_list_of_files_reader_not_batched(tmp_path, mocker, pattern):
+    """Test that patterns which cannot be translated are read with clinica_file_reader."""
+    from clinica.utils.inputs import clinica_list_of_files_reader
+
+    build_bids_directory(tmp_path, {"sub-01": ["ses-M00"]})
+    batched_reader = mocker.patch("clinica.utils.inputs._read_files_for_patterns")
+    file_reader = mocker.patch(
+        "clinica.utils.inputs.clinica_file_reader", return_value=([], [])
+    )
+
+    clinica_list_of_files_reader(
+        ["sub-01"],
+        ["ses-M00"],
+        tmp_path,
+        [
+            {"pattern": "*_T1w.nii.gz", "description": ""},
+            {"pattern": pattern, "description": ""},
+        ],
+    )
+
+    batched_reader.assert_not_called()
+    assert file_reader.call_count == 2
+
+
 def test_clinica_group_reader(tmp_path):
     from clinica.utils.inputs import clinica_group_reader
 